@@ -1,17 +1,56 @@
 """Main module for Bible. Enables looking up passages."""
 from __future__ import absolute_import
 
+import bisect
+import functools
 import re
+import sys
+import weakref
 
 import bible.data
 
+__all__ = [
+    'VERSE_RE', 'UNFORMATTED_RE', 'RANGE_LEFT_RE', 'RANGE_RIGHT_RE',
+    'FORMAT_RE', 'RangeError', 'Verse', 'parse_verse', 'Passage',
+    'book_abbreviations',
+]
+
 # regular expressions for matching a valid normalized verse string
 VERSE_RE = re.compile(r'^\d{1,2}-\d{1,3}-\d{1,3}(-[a-zA-Z]{2,})?$')
 
-# regular expressions for identifying book, and chapter:verse references
-BOOK_RE = re.compile(r'^\d*[a-zA-Z ]*')
-REF_RE = re.compile(r'\d{1,3}:\d{1,3}')
-TRANSLATION_RE = re.compile(r'[a-zA-Z]{2,}$')
+# regular expression for identifying the book, chapter:verse reference and
+# optional translation of an unformatted verse string in a single pass,
+# anchored at both ends by using fullmatch - the translation may follow a
+# space, comma, hyphen or opening parenthesis, e.g. 'John 3:16, KJV'
+UNFORMATTED_RE = re.compile(
+    r'\s*(?P<book>\d*\s*[a-zA-Z ]*?)\.?\s*'
+    r'(?P<chapter>\d{1,3}):(?P<verse>\d{1,3})'
+    r'(?:[\s,(-]*(?P<translation>[a-zA-Z]{2,})\)?)?\s*'
+)
+
+# regular expressions for the left and right sides of a hyphenated range,
+# the right side may be a verse, chapter:verse or book chapter:verse (both are
+# used with fullmatch)
+RANGE_LEFT_RE = re.compile(r'([ a-zA-Z1-3]+) ([0-9]+):([0-9]+)')
+RANGE_RIGHT_RE = re.compile(
+    r'(?:(?:(?P<book>[ a-zA-Z1-3]+) )?(?P<chapter>[0-9]+):)?'
+    r'(?P<verse>[0-9]+)'
+)
+
+# regular expression for the letters substituted in format strings
+FORMAT_RE = re.compile(r'[AaBbCcTtVvP]')
+
+# lowercase book names and abbreviations mapped to book numbers - these are
+# the same in every translation, so the table is built once at import
+_BOOK_INDEX = {
+    alias.lower(): number
+    for number, book in enumerate(bible.data.bible_data(), 1)
+    for alias in [book['name']] + book['abbrs']
+}
+
+# live Verse objects by (book, chapter, verse, translation), so equal
+# references share one object for as long as any of them is in use
+_VERSE_POOL = weakref.WeakValueDictionary()
 
 
 class RangeError(Exception):
@@ -21,6 +60,21 @@ class RangeError(Exception):
 class Verse:
     """Class to represent a Bible reference (book, chapter, and verse)."""
 
+    __slots__ = ('book', 'chapter', 'verse', 'translation', 'bible', '_key',
+                 '__weakref__')
+
+    def __new__(cls, *args):
+        """Return the existing Verse for a reference if there is one."""
+        if cls is Verse:
+            if len(args) == 1 and isinstance(args[0], str):
+                return parse_verse(args[0])
+            if len(args) >= 3:
+                translation = args[3] if len(args) > 3 else None
+                verse = _VERSE_POOL.get(args[:3] + (translation,))
+                if verse is not None:
+                    return verse
+        return super().__new__(cls)
+
     def __init__(self, *args):
         """Create a new Verse object - accepts several different inputs.
 
@@ -28,130 +82,144 @@ class Verse:
                   chapter = 2
                   verse = 1
                   Verse(book, chapter, verse)
+                  Verse(book, chapter, verse, 'ESV')
+
+                  A single reference string is parsed the same way as
+                  Verse.parse: Verse('1 Cor 12:1')
+
+        """
+        # a cached Verse from __new__ is already set up
+        if hasattr(self, '_key'):
+            return
+
+        # if we only got one value, it is a reference string to parse
+        if len(args) == 1:
+            args = self._split_reference(args[0])
+
+        # we should have 3 or 4 values: book, chapter, verse, translation
+        if len(args) < 3:
+            raise TypeError('Verse expects a reference string or book, '
+                            'chapter, verse and optional translation')
+        self.book, self.chapter, self.verse = args[:3]
+        translation = args[3] if len(args) > 3 else None
+
+        # share one string object per translation so comparisons between
+        # verses can short-circuit on identity
+        if translation is not None:
+            translation = sys.intern(translation)
+        self.translation = translation
+
+        self.bible = _bible_data(self.translation)
+        self._validate()
 
-                  normalized_string = '46-2-1'
-                  Verse(normalized_string)
+        # pack the reference into one integer that sorts in Bible order
+        self._key = self.book * 1000000 + self.chapter * 1000 + self.verse
+
+        # share this verse with later Verse() calls for the same reference
+        if type(self) is Verse:
+            _VERSE_POOL[(self.book, self.chapter, self.verse,
+                         self.translation)] = self
+
+    @classmethod
+    def parse(cls, reference):
+        """Create a new Verse object from a reference string.
+
+        Examples: normalized_string = '46-2-1'
+                  Verse.parse(normalized_string)
 
                   unformatted_string = '1 Cor 12:1'
                   unformatted_string = '1cor12:1'
                   unformatted_string = '1c 12:1'
-                  Verse(unformatted_string)
+                  Verse.parse(unformatted_string)
 
         """
-        # if we got 3 or 4 values, let's assume they are:
-        # book, chapter, verse, translation
-        if len(args) >= 3:
-            self.book = args[0]
-            self.chapter = args[1]
-            self.verse = args[2]
-            if len(args) == 4:
-                self.translation = args[3]
-            else:
-                self.translation = None
-
-        # if we only got one value, lets try to figure it out
-        elif len(args) == 1:
-            # maybe we got a normalized b-c-v(-t) string
-            try:
-                # check to make sure we have a valid verse string
-                if not VERSE_RE.search(args[0]):
-                    raise Exception('String should be in normalized b-c-v(-t) '
-                                    'format.')
-
-                # extract the parts from the string
-                parts = args[0].split('-')
-                self.book, self.chapter, self.verse = map(int, parts[:3])
-                if len(parts) > 3:
-                    self.translation = parts[3]
-                else:
-                    self.translation = None
-
-            # if not, let's try to extract the values
-            except:
-                # find the book reference
-                try:
-                    book_ref = BOOK_RE.search(args[0]).group(0)
-                except:
-                    raise RangeError("We can't find that book of the Bible: %s"
-                                     % (args[0]))
-
-                # find the chapter:verse reference
-                try:
-                    ref = REF_RE.search(args[0]).group(0)
-                except:
-                    raise Exception("Can't make sense of your chapter:"
-                                    "verse reference")
-
-                # find the translation, if provided
-                try:
-                    self.translation = TRANSLATION_RE.search(
-                        args[0]
-                    ).group(0).upper()
-                except:
-                    self.translation = None
-
-                # try to find the book listed as a book name or abbreviation
-                self.bible = bible.data.bible_data(self.translation)
-                book_ref = book_ref.rstrip('.').lower().strip()
-                for i, book in enumerate(self.bible):
-                    if book['name'].lower() == book_ref:
-                        found = i + 1
-                        break
-                    else:
-                        for abbr in book['abbrs']:
-                            if abbr == book_ref:
-                                found = i + 1
-                                break
-                try:
-                    self.book = found
-                except:
-                    raise RangeError("Can't find that book of the Bible: "
-                                     + book_ref)
-
-                # extract chapter and verse from ref
-                self.chapter, self.verse = map(int, ref.split(':'))
-
-        # if we didn't add the bible attribute above, add it now
-        if 'bible' not in self.__dict__:
-            self.bible = bible.data.bible_data(self.translation)
-
-        # check to see if the chapter is in range for the given book
-        try:
-            verse_count = self.bible[self.book - 1]['verse_counts'][
-                self.chapter - 1
-            ]
-        except:
+        return cls(*cls._split_reference(reference))
+
+    @staticmethod
+    def _split_reference(reference):
+        """Return (book, chapter, verse, translation) for a reference."""
+        if not isinstance(reference, str):
+            raise RangeError("Can't make sense of your verse reference: %r"
+                             % (reference, ))
+
+        # maybe we got a normalized b-c-v(-t) string
+        if VERSE_RE.match(reference):
+            parts = reference.split('-')
+            translation = parts[3] if len(parts) > 3 else None
+            return (int(parts[0]), int(parts[1]), int(parts[2]), translation)
+
+        # if not, let's try to extract the values
+        match = UNFORMATTED_RE.fullmatch(reference)
+        if match is None:
+            raise RangeError("Can't make sense of your verse reference: %s"
+                             % reference)
+
+        # find the translation, if provided
+        translation = match.group('translation')
+        if translation:
+            translation = translation.upper()
+
+        # try to find the book listed as a book name or abbreviation
+        book_ref = match.group('book').lower().strip()
+        book = _BOOK_INDEX.get(book_ref)
+        if book is None:
+            raise RangeError("Can't find that book of the Bible: " + book_ref)
+
+        return (book, int(match.group('chapter')), int(match.group('verse')),
+                translation)
+
+    def _validate(self):
+        """Raise RangeError if the verse does not exist in its translation."""
+        # check to see if the book and chapter are in range
+        if not 1 <= self.book <= len(self.bible):
+            raise RangeError("There is no book %s in the Bible" % self.book)
+        book = self.bible[self.book - 1]
+        if not 1 <= self.chapter <= len(book['verse_counts']):
             raise RangeError("There are not that many chapters in %s"
-                             % self.bible[self.book - 1]['name'])
+                             % book['name'])
 
         # check to see if the verse is in range for the given chapter
-        if verse_count < self.verse:
+        if book['verse_counts'][self.chapter - 1] < self.verse:
             raise RangeError(
                 "There is no verse %s in %s %s" % (
                     self.verse,
-                    self.bible[self.book - 1]['name'],
+                    book['name'],
                     self.chapter)
             )
 
         # check to see if the specified verse is omitted
-        try:
-            omitted = self.verse in self.bible[self.book - 1]['omissions'][
-                self.chapter - 1
-            ]
-            try:
-                err = 'This verse is omitted from the %s translation.' \
-                    % self.translation
-            except:
-                err = 'This verse is omitted from all modern translations.'
-        except:
-            omitted = False
-        if omitted:
-            raise RangeError(err)
+        omissions = book.get('omissions', ())
+        if self.chapter <= len(omissions) \
+                and self.verse in omissions[self.chapter - 1]:
+            raise RangeError('This verse is omitted from the %s translation.'
+                             % self.translation)
+
+    def __setattr__(self, name, value):
+        # verses are shared by the caches, so freeze them once set up
+        if hasattr(self, '_key'):
+            raise AttributeError('Verse objects are immutable')
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        return (type(self),
+                (self.book, self.chapter, self.verse, self.translation))
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Verse):
+            return NotImplemented
         return (self.book == other.book and self.chapter == other.chapter
             and self.verse == other.verse and self.translation == other.translation)
 
+    def __hash__(self):
+        """Hash on the reference so verses can be used in sets and dicts.
+
+        Verses are treated as immutable: don't change the book, chapter,
+        verse or translation after creating one.
+        """
+        return self._key ^ hash(self.translation)
+
     def __unicode__(self):
         return self.format()
 
@@ -163,15 +231,11 @@ class Verse:
 
         Letters are substituted for verse attributes, like date formatting
         """
-        # create blank string to hold output
-        formatted_string = ""
-
-        # iterate over letters in val string passed in to method
-        for chara in val:
-            formatted_string += _format_char(self, chara)
-
-        # return the formatted value
-        return formatted_string.strip()
+        # substitute each format letter in val string passed in to method
+        return ''.join(
+            formatter(self) if formatter else text
+            for text, formatter in _compile_format(val)
+        ).strip()
 
     def __repr__(self):
         return self.to_string()
@@ -181,21 +245,32 @@ class Verse:
 
         This is especially useful for saving to a database
         """
-        # set the base string to book, chapter, and verse number
-        verse_str = "%s-%s-%s" % (str(self.book), str(self.chapter),
-                                  str(self.verse))
+        # book, chapter, and verse number, plus the version if it is set
+        verse_str = f"{self.book}-{self.chapter}-{self.verse}"
+        if self.translation is not None:
+            return f"{verse_str}-{self.translation}"
+        return verse_str
+
 
-        # try to add the version to the string
-        # - if not set, just return the base string
-        try:
-            return verse_str + '-' + str(self.translation)
-        except:
-            return verse_str
+@functools.lru_cache(maxsize=4096)
+def parse_verse(reference):
+    """Return a Verse for a reference string, reusing earlier results.
+
+    Verses are immutable, so repeated references share one Verse object
+    instead of being parsed again. Verse(reference) goes through here too.
+
+    Examples: parse_verse('1 Cor 12:1')
+              parse_verse('46-12-1')
+    """
+    return Verse.parse(reference)
 
 
 class Passage:
     """A passage of scripture with start and end verses."""
 
+    __slots__ = ('start', 'end', 'bible', '_formatted', '_start_key',
+                 '_end_key')
+
     def __init__(self, start, end=None):
         """Create a new Passage object.
 
@@ -203,8 +278,8 @@ class Passage:
         Verse objects. If there is no value provided for end, it signals that
         start is a string with a hyphen indicating a range.
 
-        Examples: v1 = Verse('Rom. 1:1')
-                  v2 = Verse('Rom. 1:8')
+        Examples: v1 = parse_verse('Rom. 1:1')
+                  v2 = parse_verse('Rom. 1:8')
                   Passage(v1, v2)
 
                   Passage('Rom. 1:1', 'Rom. 1:8')
@@ -218,16 +293,8 @@ class Passage:
 
         # if the args passed were objects, add them to the Passage
         # directly, otherwise try to interpret them as strings
-        if type(start).__name__ == 'instance'   \
-                or type(start).__name__ == 'Verse':
-            self.start = start
-        else:
-            self.start = Verse(start)
-        if type(end).__name__ == 'instance'   \
-                or type(end).__name__ == 'Verse':
-            self.end = end
-        else:
-            self.end = Verse(end)
+        self.start = start if isinstance(start, Verse) else parse_verse(start)
+        self.end = end if isinstance(end, Verse) else parse_verse(end)
 
         # make sure start and end verses are in the same translation
         if self.start.translation != self.end.translation:
@@ -236,6 +303,21 @@ class Passage:
         else:
             self.bible = self.start.bible
 
+        # formatted strings by format string, filled in by format()
+        self._formatted = dict()
+
+        self._start_key = self.start._key
+        self._end_key = self.end._key
+
+    def __setattr__(self, name, value):
+        # formatted strings are cached, so freeze the passage once set up
+        if hasattr(self, '_end_key'):
+            raise AttributeError('Passage objects are immutable')
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        return (type(self), (self.start, self.end))
+
     def _parse_range(self, expression):
         """Try to split a range verse expression with a hyphen into two strings that
         can be handled by Verse constructor
@@ -254,7 +336,7 @@ class Passage:
         So, there should be one and only one hyphen, we just need to learn
         what parts change from left of hyphen to right of hyphen
         """
-        if type(expression).__name__ != 'str':
+        if not isinstance(expression, str):
             raise Exception('Expected string argument to Passage')
 
         if expression.count('-') != 1:
@@ -262,94 +344,38 @@ class Passage:
             raise Exception(exc_str)
 
         left, right = expression.split('-')
-        left_re = '([ a-zA-Z1-3]+) ([0-9]+):([0-9]+)$'
-        left_match = re.match(left_re, left)
+        left_match = RANGE_LEFT_RE.fullmatch(left)
         if not left_match:
             raise Exception('Error in format of verse range expression. '
                             'Problem on left side of hyphen')
-        book = left_match.group(1)
-        chapter = left_match.group(2)
-        # verse = left_match.group(3)
-
-        # these are defaults for right side
-        right_book = book
-        right_chapter = chapter
-        # just initialize as empty, will always be overwritten
-        right_verse = ''
-
-        right_unfinished = True
-        # now, what can we have on right side? Just a verse, easy
-        right_re1 = '[0-9]+$'
-        right_match = re.match(right_re1, right)
-        if right_match:
-            right_verse = right
-            right_unfinished = False
-
-        # now, just chapter and verse
-        if right_unfinished:
-            right_re2 = '([0-9]+):([0-9]+)$'
-            right_match2 = re.match(right_re2, right)
-            if right_match2:
-                right_chapter = right_match2.group(1)
-                right_verse = right_match2.group(2)
-                right_unfinished = False
-
-        # so, its book, chapter and verse on right side of hyphen
-        if right_unfinished:
-            right_match3 = re.match(left_re, right)
-            if not right_match3:
-                raise Exception('Error in format of verse range expression. '
-                                'Problem on right side of hyphen')
-            right_book = right_match3.group(1)
-            right_chapter = right_match3.group(2)
-            right_verse = right_match3.group(3)
+
+        # the right side may be just a verse, chapter and verse, or book,
+        # chapter and verse - anything missing is the same as the left side
+        right_match = RANGE_RIGHT_RE.fullmatch(right)
+        if not right_match:
+            raise Exception('Error in format of verse range expression. '
+                            'Problem on right side of hyphen')
+        right_book = right_match.group('book') or left_match.group(1)
+        right_chapter = right_match.group('chapter') or left_match.group(2)
+        right_verse = right_match.group('verse')
 
         complete_right = right_book + ' ' + right_chapter + ':' + right_verse
-        return (Verse(left), Verse(complete_right), )
+        return (parse_verse(left), parse_verse(complete_right), )
 
     def __unicode__(self):
         return self.smart_format()
 
     def includes(self, verse):
         """Check to see if a verse is included in a passage."""
-        # check to see if the book is out of range
-        if verse.book < self.start.book or verse.book > self.end.book:
+        # check to see if the verse is out of range
+        if not self._start_key <= verse._key <= self._end_key:
             return False
 
-        # if the verse is in the same book as the start verse
-        if verse.book == self.start.book:
-
-            # make sure the verse is not in an earlier chapter than the start
-            # verse
-            if verse.chapter < self.start.chapter:
-                return False
-
-            # make sure verse is not in same chapter as start verse, but before
-            # it
-            if verse.chapter == self.start.chapter and \
-                    verse.verse < self.start.verse:
-                return False
-
-        # if the verse is in the same book as the end verse
-        if verse.book == self.end.book:
-
-            # make sure the verse is not in a later chapter than the end verse
-            if verse.chapter > self.end.chapter:
-                return False
-
-            # make sure verse is not in same chapter as end verse, but after it
-            if verse.chapter == self.end.chapter and \
-                    verse.verse > self.end.verse:
-                return False
-
         # make sure verse is not omitted
-        real_book = verse.book - 1
-        real_chapt = verse.chapter - 1
-        if 'omissions' in self.bible[real_book]:
-            if len(self.bible[real_book]['omissions']) >= verse.chapter:
-                the_omis = self.bible[real_book]['omissions'][real_chapt]
-                if verse.verse in the_omis:
-                    return False
+        omissions = self.bible[verse.book - 1].get('omissions', ())
+        if verse.chapter <= len(omissions) \
+                and verse.verse in omissions[verse.chapter - 1]:
+            return False
 
         # if we haven't failed out yet, then the verse is included
         return True
@@ -360,57 +386,24 @@ class Passage:
     def overlap(self, passage):
         """Check to see if two passages have any overlap."""
 
-        # check for disjoint scenarios, book, chapter, verse
-        if self.end.book < passage.start.book:
-            return False
-        if passage.end.book < self.start.book:
-            return False
-        if self.end.book == passage.start.book  \
-                and self.end.chapter < passage.start.chapter:
-            return False
-        if passage.end.book == self.start.book  \
-                and passage.end.chapter < self.start.chapter:
-            return False
-        if self.end.book == passage.start.book  \
-                and self.end.chapter == passage.start.chapter \
-                and self.end.verse < passage.start.verse:
-            return False
-        if passage.end.book == self.start.book  \
-                and passage.end.chapter == self.start.chapter \
-                and passage.end.verse < self.start.verse:
+        # check for disjoint scenarios, one passage ending before the other
+        # starts
+        if self._end_key < passage._start_key \
+                or passage._end_key < self._start_key:
             return False
 
         # all disjoint cases handled above, now make sure self and passage
         # are not omitted. For an omission to matter, we must have either
         # self or passage be single book and single chapter.
-        real_chapter = self.start.chapter - 1
-        real_book = self.start.book - 1
-        if 'omissions' in self.bible[real_book]:
-            len_omissions = len(self.bible[real_book]['omissions'])
-        else:
-            len_omissions = 0
-        if self.start.book == self.end.book  \
-                and self.start.chapter == self.end.chapter:
-            # OK, single book/chapter for self
-            if 'omissions' in self.bible[real_book]  \
-                and len_omissions >= passage.chapter  \
-                and self.start.verse in  \
-                    self.bible[real_book]['omissions'][real_chapter]:
-                # self is in omitted verses, so no overlap
-                return False
-
-        if passage.start.book == passage.end.book  \
-                and passage.start.chapter == passage.end.chapter:
-            # OK, single book/chapter for passage
-            real_book = passage.start.book - 1
-            real_chapter = passage.start.chapter - 1
-            if 'omissions' in passage.bible[real_book]:
-                len_omis = len(passage.bible[real_book]['omissions'])
-                list_omis = passage.bible[real_book]['omissions'][real_chapter]
-                if len_omis >= passage.chapter  \
-                        and passage.start.verse in list_omis:
-
-                    # passage is in omitted verses, so no overlap
+        for part in (self, passage):
+            if part.start.book == part.end.book  \
+                    and part.start.chapter == part.end.chapter:
+                omissions = part.bible[part.start.book - 1].get(
+                    'omissions', ())
+                if part.start.chapter <= len(omissions)  \
+                        and part.start.verse in  \
+                        omissions[part.start.chapter - 1]:
+                    # part is in omitted verses, so no overlap
                     return False
 
         # all non-overlapping cases handled above so what is left is partial
@@ -422,88 +415,20 @@ class Passage:
 
     def length(self):
         """Count the total number of verses in the passage."""
-        # start and end are in the same book
-        if self.start.book == self.end.book:
+        chapter_offsets, chapter_starts, omitted = _verse_ordinals(
+            self.start.translation)
+        start = chapter_starts[chapter_offsets[self.start.book - 1]
+                               + self.start.chapter - 1] + self.start.verse
+        end = chapter_starts[chapter_offsets[self.end.book - 1]
+                             + self.end.chapter - 1] + self.end.verse
 
-            # start and end are in the same chapter of the same book
-            if self.start.chapter == self.end.chapter:
-                count = self._count_verses(
-                    self.start.book,
-                    self.start.chapter,
-                    self.start.verse,
-                    self.end.verse
-                )
-
-            # start and end are in different chapters of the same book
-            else:
+        # a passage that ends before it starts has no verses
+        if end < start:
+            return 0
 
-                # get number of verses in start chapter
-                count = self._count_verses(
-                    self.start.book,
-                    self.start.chapter,
-                    start=self.start.verse
-                )
-
-                # add number of verses in whole chapters between start and end
-                for chapter in range(self.start.chapter + 1, self.end.chapter):
-                    count += self._count_verses(self.start.book, chapter)
-
-                # add the number of verses in the end chapter
-                count += self._count_verses(self.end.book,
-                                            self.end.chapter,
-                                            end=self.end.verse)
-
-        # start and end are in different books
-        else:
-
-            # get number of verses in first chapter of start book
-            count = self._count_verses(
-                self.start.book, self.start.chapter, start=self.start.verse)
-
-            # add number of verses in whole chapters of start book
-            real_start = self.start.book - 1
-            len_chapters = len(self.bible[real_start]['verse_counts'])
-            for chapter in range(self.start.chapter, len_chapters):
-                count += self._count_verses(self.start.book, chapter)
-
-            # add total number of verses in whole books between start and end
-            for book in range(self.start.book + 1, self.end.book):
-                for chapter in self.bible[book - 1]['verse_counts']:
-                    count += self._count_verses(self.start.book, chapter)
-
-            # add number of verses in whole chapters of end book
-            for chapter in range(1, self.end.chapter):
-                count += self._count_verses(self.end.book, chapter)
-
-            # get the number of verses in last chapter of end book
-            count += self._count_verses(self.end.book,
-                                        self.end.chapter,
-                                        end=self.end.verse)
-
-        # return the count
-        return count
-
-    def _count_verses(self, book, chapter, start=False, end=False):
-        """Count number of non-omitted verses in chapter or range of verses."""
-        # get book data
-        book = self.bible[book - 1]
-
-        # create list with all verses to look at
-        if not start:
-            start = 1
-        if not end:
-            end = book['verse_counts'][chapter - 1]
-        verses = list(range(start, end + 1))
-
-        # remove omissions from list of verses
-        if 'omissions' in book and len(book['omissions']) >= chapter:
-            omissions = book['omissions'][chapter - 1]
-            for verse in omissions:
-                if verse in verses:
-                    verses.remove(verse)
-
-        # send back a count of the verses that survived
-        return len(verses)
+        # count every verse in the span, less the omitted ones inside it
+        return end - start + 1 - (bisect.bisect_right(omitted, end)
+                                  - bisect.bisect_left(omitted, start))
 
     def format(self, val=None):
         """Return a formatted string to represent the passage.
@@ -512,26 +437,34 @@ class Passage:
         Lowercase letters (a, b, c, and v) refer to end verse reference
         The letter P inserts the smart_format() string for the passage
         """
+        # passages don't change, so reuse the string if we made it before
+        formatted_str = self._formatted.get(val)
+        if formatted_str is not None:
+            return formatted_str
+
         # if we got a string, process it and return formatted verse
         if val:
 
-            # create blank string to hold output
-            formatted_str = ""
-
-            # iterate over letters in val string passed in to method
-            for chara in val:
-                if chara == "P":
-                    formatted_str += self.smart_format()
-                elif chara.isupper():
-                    formatted_str += _format_char(self.start, chara)
+            # substitute each format letter in val string passed in to method,
+            # uppercase letters for the start verse and lowercase for the end
+            parts = list()
+            for text, formatter in _compile_format(val):
+                if text == "P":
+                    parts.append(self.smart_format())
+                elif formatter is None:
+                    parts.append(text)
+                elif text.isupper():
+                    parts.append(formatter(self.start))
                 else:
-                    formatted_str += _format_char(self.end, chara)
-
-            # return formatted string
-            return formatted_str.strip()
+                    parts.append(formatter(self.end))
+            formatted_str = ''.join(parts).strip()
 
         # if we didn't get a formatting string, send back the smart_format()
-        return self.smart_format()
+        else:
+            formatted_str = self.smart_format()
+
+        self._formatted[val] = formatted_str
+        return formatted_str
 
     def smart_format(self):
         """Display a human-readible string for passage.
@@ -567,41 +500,85 @@ class Passage:
         return formatted_str
 
 
-def _format_char(verse, char):
-    """Return a string for the part of a verse.
-
-    Represented by a formatting char:
-
-    A - Book abbreviation (e.g. "Gen", "Rom")
-    B - Full book name (e.g. "Genesis", "Romans")
-    C - Chapter number
-    V - Verse number
-    T - Translation
+# functions returning the string for each (uppercase) formatting char:
+#   A - Book abbreviation (e.g. "Gen", "Rom")
+#   B - Full book name (e.g. "Genesis", "Romans")
+#   C - Chapter number
+#   V - Verse number
+#   T - Translation (empty if not set)
+_FORMATTERS = {
+    'A': lambda verse: verse.bible[verse.book - 1]['abbrs'][0].title(),
+    'B': lambda verse: verse.bible[verse.book - 1]['name'],
+    'C': lambda verse: str(verse.chapter),
+    'V': lambda verse: str(verse.verse),
+    'T': lambda verse: (str(verse.translation)
+                        if verse.translation is not None else ""),
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_format(val):
+    """Split a format string into a tuple of (text, formatter) pairs.
+
+    Each format letter gets its own pair with its _FORMATTERS function, and
+    the text between them is kept as is with a formatter of None.
+    """
+    tokens = list()
+    pos = 0
+    for match in FORMAT_RE.finditer(val):
+        if match.start() > pos:
+            tokens.append((val[pos:match.start()], None))
+        char = match.group(0)
+        tokens.append((char, _FORMATTERS.get(char.upper())))
+        pos = match.end()
+    if pos < len(val):
+        tokens.append((val[pos:], None))
+    return tuple(tokens)
+
+
+@functools.lru_cache(maxsize=8)
+def _bible_data(translation=None):
+    """Return reference data for a translation, built once and shared.
+
+    Omissions are stored as a tuple with a frozenset of verses per chapter.
+    """
+    data = bible.data.bible_data(translation)
+    for book in data:
+        if 'omissions' in book:
+            book['omissions'] = tuple(frozenset(verses or ())
+                                      for verses in book['omissions'])
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _verse_ordinals(translation):
+    """Return flat tables numbering every verse of a translation in order.
+
+    chapter_offsets[book - 1] is the index of the book's first chapter in
+    chapter_starts, and chapter_starts[that index + chapter - 1] + verse is
+    the ordinal of a verse, counting omitted verses. omitted is the sorted
+    list of ordinals of the omitted verses, so verses in a span can be
+    counted with bisect.
     """
-    # use uppercase letter for comparison
-    char_upper = char.upper()
-
-    # replace vals for start verse
-    if char_upper == "B":
-        return verse.bible[verse.book - 1]['name']
-    if char_upper == "A":
-        return verse.bible[verse.book - 1]['abbrs'][0].title()
-    if char_upper == "C":
-        return str(verse.chapter)
-    if char_upper == "V":
-        return str(verse.verse)
-    if char_upper == "T":
-        try:
-            return str(verse.translation)
-        except:
-            return ""
-    else:
-        return char
+    chapter_offsets = [0]
+    chapter_starts = list()
+    omitted = list()
+    ordinal = 0
+    for book in _bible_data(translation):
+        omissions = book.get('omissions', ())
+        for i, count in enumerate(book['verse_counts']):
+            chapter_starts.append(ordinal)
+            if i < len(omissions):
+                omitted.extend(ordinal + verse for verse in omissions[i])
+            ordinal += count
+        chapter_offsets.append(len(chapter_starts))
+    omitted.sort()
+    return chapter_offsets, chapter_starts, omitted
 
 
 def book_abbreviations():
     """Return a string listing all the bible book abbreviations"""
-    bible_data = bible.data.bible_data()
+    bible_data = _bible_data(None)
     lines = list()
     for book in bible_data:
         lines.append(book['name']+':'+','.join(book['abbrs']))
@@ -6,23 +6,47 @@ import bible
 
 
 class TestPassage(unittest.TestCase):
-    def setUp(self):
-        self.romans = bible.Passage('Romans 1:1', 'Romans 16:27')
-        self.romans_smaller = bible.Passage('Romans 2:1', 'Romans 2:4')
-        self.acts = bible.Passage('Acts 10:22', 'Acts 10:27')
-        self.acts_skewed = bible.Passage('Acts 10:14', 'Acts 10:22')
-        self.acts_disjoint = bible.Passage('Acts 10:14', 'Acts 10:21')
-        self.two_books = bible.Passage('Acts 1:1', 'Romans 16:27')
+    @classmethod
+    def setUpClass(cls):
+        # passages are never modified by the tests, so build them once
+        cls.romans = bible.Passage('Romans 1:1', 'Romans 16:27')
+        cls.romans_smaller = bible.Passage('Romans 2:1', 'Romans 2:4')
+        cls.acts = bible.Passage('Acts 10:22', 'Acts 10:27')
+        cls.acts_skewed = bible.Passage('Acts 10:14', 'Acts 10:22')
+        cls.acts_disjoint = bible.Passage('Acts 10:14', 'Acts 10:21')
+        cls.two_books = bible.Passage('Acts 1:1', 'Romans 16:27')
 
     def test_len(self):
         self.assertEqual(self.romans.length(), len(self.romans))
         self.assertEqual(len(self.romans), 433)
+        self.assertEqual(len(self.two_books), 1440)
+
+        # reversed passages have no verses
+        self.assertEqual(len(bible.Passage('Rom 1:5', 'Rom 1:3')), 0)
+        self.assertEqual(len(bible.Passage('Rom 2:1', 'Rom 1:3')), 0)
+
+    def test_len_omissions(self):
+        # omissions only apply to uppercase translation names
+        with self.assertRaises(bible.RangeError):
+            bible.Verse(44, 8, 37, 'ESV')
+        acts_8 = bible.Passage(bible.Verse(44, 8, 36, 'ESV'),
+                               bible.Verse(44, 8, 38, 'ESV'))
+        self.assertEqual(len(acts_8), 2)
+        # Acts 8:37, 15:34, 24:7, 28:29 and Rom 16:24 are omitted in ESV
+        two_books = bible.Passage(bible.Verse(44, 1, 1, 'ESV'),
+                                  bible.Verse(45, 16, 27, 'ESV'))
+        self.assertEqual(len(two_books), 1440 - 5)
 
     def test_includes(self):
         self.assertFalse(self.romans.includes(bible.Verse('Gen 1:1')))
         self.assertTrue(self.romans.includes(bible.Verse('Rom 3:23')))
         self.assertTrue(self.two_books.includes(bible.Verse('Acts 2:39')))
 
+        # Matthew 1 has no omissions in ESV, but later chapters do
+        matthew = bible.Passage(bible.Verse(40, 1, 1, 'ESV'),
+                                bible.Verse(40, 28, 20, 'ESV'))
+        self.assertTrue(matthew.includes(bible.Verse(40, 1, 1, 'ESV')))
+
         from bible import RangeError
         with self.assertRaises(RangeError):
             # no apocrypha / deuterocanon
@@ -65,6 +89,14 @@ class TestPassage(unittest.TestCase):
         self.assertTrue(self.acts.overlap(self.acts_skewed))
         self.assertFalse(self.acts.overlap(self.acts_disjoint))
 
+        # single-chapter passages in a book with omissions
+        acts_8 = bible.Passage(bible.Verse(44, 8, 36, 'ESV'),
+                               bible.Verse(44, 8, 38, 'ESV'))
+        acts_8_wider = bible.Passage(bible.Verse(44, 8, 30, 'ESV'),
+                                     bible.Verse(44, 8, 40, 'ESV'))
+        self.assertTrue(acts_8.overlap(acts_8_wider))
+        self.assertTrue(acts_8_wider.overlap(acts_8))
+
     def test_format(self):
         self.assertEqual(self.romans.format(), 'Romans 1:1 - 16:27')
         self.assertEqual(self.romans.format('B C:V-c:v'), 'Romans 1:1-16:27')
@@ -75,12 +107,17 @@ class TestPassage(unittest.TestCase):
         self.assertEqual(self.romans.format('P v'), 'Romans 1:1 - 16:27 27')
 
         # not capable of adding into other than format strings, don't do this
-        silly = "Romans 1:1 - 16:27Romul's leNoneNoneer Noneo Nonehe Romans"
+        silly = "Romans 1:1 - 16:27Romul's leer o he Romans"
         self.assertEqual(self.romans.format("Paul's letter to the B"), silly)
         # if you want that, do this instead:
         right = "Paul's letter to the {}.".format(self.romans.format('B'))
         self.assertEqual("Paul's letter to the Romans.", right)
 
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.romans.end = bible.Verse('Romans 2:1')
+        self.assertEqual(self.romans.format('B C:V-c:v'), 'Romans 1:1-16:27')
+
     def test_smart_format(self):
         self.assertEqual(self.romans.smart_format(), 'Romans 1:1 - 16:27')
         self.assertEqual(self.two_books.smart_format(),
@@ -93,19 +130,59 @@ class TestPassage(unittest.TestCase):
 
 
 class TestVerse(unittest.TestCase):
-    def setUp(self):
-        self.eph2_10 = bible.Verse('Eph 2:10')
-        self.acts_8_37_kjv = bible.Verse(44, 8, 37, 'kvj')
+    @classmethod
+    def setUpClass(cls):
+        # verses are immutable, so build them once for all tests
+        cls.eph2_10 = bible.Verse('Eph 2:10')
+        cls.acts_8_37_kjv = bible.Verse(44, 8, 37, 'kvj')
         # Acts 8:37 doesn't exist in ESV, testing omissions from data.py
-        self.acts_8_37_esv = bible.Verse(44, 8, 37, 'esv')
+        cls.acts_8_37_esv = bible.Verse(44, 8, 37, 'esv')
 
     def test_equals(self):
         other = bible.Verse('Eph 2:10')
         self.assertTrue(self.eph2_10 == other)
 
+    def test_parse(self):
+        self.assertEqual(bible.Verse.parse('Eph 2:10'), self.eph2_10)
+        self.assertEqual(bible.Verse.parse('44-8-37-esv'), self.acts_8_37_esv)
+        self.assertEqual(repr(bible.Verse.parse('1 Cor 12:1')), '46-12-1')
+        self.assertEqual(repr(bible.Verse.parse('1cor12:1')), '46-12-1')
+        self.assertEqual(repr(bible.Verse.parse('Rom. 1:1 esv')), '45-1-1-ESV')
+        self.assertEqual(repr(bible.Verse.parse('John 3:16, KJV')),
+                         '43-3-16-KJV')
+        self.assertEqual(repr(bible.Verse.parse('Gen 1:1-ESV')), '1-1-1-ESV')
+        self.assertEqual(repr(bible.Verse.parse('Gen 1:1 (ESV)')),
+                         '1-1-1-ESV')
+        with self.assertRaises(bible.RangeError):
+            bible.Verse.parse('Eph 2')
+        with self.assertRaises(bible.RangeError):
+            bible.Verse(5)
+
+    def test_parse_verse(self):
+        self.assertEqual(bible.parse_verse('Eph 2:10'), self.eph2_10)
+        self.assertIs(bible.parse_verse('Eph 2:10'),
+                      bible.parse_verse('Eph 2:10'))
+
+    def test_immutable(self):
+        self.assertIs(bible.Verse('Eph 2:10'), bible.Verse('Eph 2:10'))
+        self.assertIs(bible.Verse(49, 2, 10), self.eph2_10)
+        self.assertIs(bible.Verse(44, 8, 37, 'esv'), self.acts_8_37_esv)
+        with self.assertRaises(AttributeError):
+            self.eph2_10.verse = 11
+
     def test_equals_with_both_translations_set(self):
         self.assertTrue(bible.Verse(1, 2, 3, 'kjv') == bible.Verse(1, 2, 3, 'kjv'))
 
+    def test_hash(self):
+        verses = {self.eph2_10, bible.Verse('Eph 2:10'),
+                  bible.Verse('49-2-10')}
+        self.assertEqual(len(verses), 1)
+        verses = {self.acts_8_37_kjv, self.acts_8_37_esv}
+        self.assertEqual(len(verses), 2)
+        # verses can share containers with other kinds of keys
+        self.assertFalse(self.eph2_10 == 'Eph 2:10')
+        self.assertTrue(self.eph2_10 != 'Eph 2:10')
+
     def test_format(self):
         self.assertEqual(self.acts_8_37_esv.format('b c:v'),
                          self.acts_8_37_esv.format('B C:V'))